@@ -59,6 +59,20 @@ def get_git_diff(file_path):
         print(f"Error fetching git diff for {file_path}: {e}")
         return None
 
+def get_git_dir(repo_path):
+    """
+    Returns the absolute path of the `.git` directory for the given repository,
+    or None if it cannot be determined.
+    """
+    try:
+        git_dir = subprocess.check_output(
+            ['git', '-C', repo_path, 'rev-parse', '--absolute-git-dir']
+        ).decode('utf-8').strip()
+        return git_dir
+    except subprocess.CalledProcessError as e:
+        print(f"Error locating git directory for {repo_path}: {e}")
+        return None
+
 if __name__ == "__main__":
     # Expect the repository path as a command-line argument
     if len(sys.argv) < 2:
@@ -1,11 +1,13 @@
 import requests
 import json
 from git_changes import get_git_diff
+from run_journal import hash_diff
 
 
-def commit_file_to_lm_studio(file_data, api_url, api_token):
+def commit_file_to_lm_studio(file_data, api_url, api_token, git_diff=None):
     """
     Commits a single file to the LM Studio server using the API.
+    The Git diff is fetched for the file unless one is passed in.
     Returns the extracted commit message (JSON) or None on failure.
     """
     if not api_token:
@@ -17,7 +19,8 @@ def commit_file_to_lm_studio(file_data, api_url, api_token):
         "Content-Type": "application/json",
     }
 
-    git_diff = get_git_diff(file_data['path'])
+    if git_diff is None:
+        git_diff = get_git_diff(file_data['path'])
     if not git_diff:
         print(f"No diff available for {file_data['path']}. Skipping file.")
         return None
@@ -74,24 +77,43 @@ def commit_file_to_lm_studio(file_data, api_url, api_token):
         return None
 
 
-def commit_files_to_lm_studio(files, api_url, api_token):
+def commit_files_to_lm_studio(files, api_url, api_token, journal=None, completed=None):
     """
     Commits multiple files to the LM Studio server.
 
     :param files: A list of dictionaries with file 'path' and 'content'.
     :param api_url: The LM Studio API endpoint for committing files.
     :param api_token: The API token for authentication.
+    :param journal: An optional RunJournal that records each result as it completes.
+    :param completed: An optional mapping of path to (diff_hash, result) from a
+                      previous run; files whose diff is unchanged are not resent.
     :return: A list of extracted commit messages (JSON).
     """
     if not api_token:
         print("Error: API token is missing.")
         return []
 
+    completed = completed or {}
     results = []
     for file_data in files:
-        commit_message = commit_file_to_lm_studio(file_data, api_url, api_token)
+        git_diff = None
+        diff_hash = None
+        if journal is not None or completed:
+            git_diff = get_git_diff(file_data['path'])
+            if git_diff:
+                diff_hash = hash_diff(git_diff)
+
+        previous = completed.get(file_data['path'])
+        if previous is not None and diff_hash is not None and previous[0] == diff_hash:
+            print(f"Already generated, resuming past: {file_data['path']}")
+            results.append(previous[1])
+            continue
+
+        commit_message = commit_file_to_lm_studio(file_data, api_url, api_token, git_diff)
         if commit_message is None:
             print(f"Skipping file: {file_data['path']}")
+        if journal is not None and diff_hash is not None:
+            journal.record(file_data['path'], diff_hash, commit_message)
         results.append(commit_message)
     return results
 
@@ -1,9 +1,10 @@
 import os
 import sys
 import subprocess
-from git_changes import get_git_changes
+from git_changes import get_git_changes, get_git_dir
 from file_processor import process_files
 from lm_studio_committer import commit_file_to_lm_studio, commit_files_to_lm_studio
+from run_journal import RunJournal, load_completed, DEFAULT_JOURNAL_NAME
 
 def install_and_import(package):
     """
@@ -61,7 +62,7 @@ def interactive_commit(repo_path, lm_studio_api_url, lm_studio_api_token):
         else:
             print(f"Commit skipped for: {file_data['path']}")
 
-def main(repo_path, interactive_mode=False):
+def main(repo_path, interactive_mode=False, resume=False):
     # Configuration
     lm_studio_api_url = "http://localhost:1234/v1/completions"  # LM Studio API endpoint
     lm_studio_api_token = "your_api_token_here"  # Replace with your actual API token
@@ -70,6 +71,10 @@ def main(repo_path, interactive_mode=False):
         print("Starting interactive mode...")
         interactive_commit(repo_path, lm_studio_api_url, lm_studio_api_token)
     else:
+        # Locate the journal before get_git_changes switches the working directory
+        git_dir = get_git_dir(repo_path) or os.path.abspath(repo_path)
+        journal_path = os.path.join(git_dir, DEFAULT_JOURNAL_NAME)
+
         # Fetch Git changes
         print("Fetching Git changes...")
         git_changes = get_git_changes(repo_path)
@@ -86,9 +91,19 @@ def main(repo_path, interactive_mode=False):
             print("No valid files to process.")
             return
 
+        # Journal results as they complete so an interrupted run can be resumed
+        completed = {}
+        if resume:
+            completed = load_completed(journal_path)
+            print(f"Resuming from journal: {journal_path} ({len(completed)} files already done)")
+
         # Commit files
         print("Committing files to LM Studio...")
-        responses = commit_files_to_lm_studio(processed_files, lm_studio_api_url, lm_studio_api_token)
+        with RunJournal(journal_path, resume=resume) as journal:
+            responses = commit_files_to_lm_studio(
+                processed_files, lm_studio_api_url, lm_studio_api_token,
+                journal=journal, completed=completed
+            )
 
         # Log results
         print("Commit results:")
@@ -99,14 +114,15 @@ if __name__ == "__main__":
     install_and_import("requests")
 
     if len(sys.argv) < 2:
-        print("Usage: python main.py <repo_path> [--interactive]")
+        print("Usage: python main.py <repo_path> [--interactive] [--resume]")
         sys.exit(1)
 
     repository_path = sys.argv[1]
     interactive_mode = '--interactive' in sys.argv
+    resume = '--resume' in sys.argv
 
     if not os.path.exists(repository_path):
         print(f"Error: The specified path does not exist: {repository_path}")
         sys.exit(1)
 
-    main(repository_path, interactive_mode)
+    main(repository_path, interactive_mode, resume)
@@ -0,0 +1,132 @@
+import os
+import json
+import hashlib
+
+
+DEFAULT_JOURNAL_NAME = "lm_studio_journal.jsonl"
+
+
+def hash_diff(git_diff):
+    """
+    Returns the SHA-256 hex digest of a Git diff, used to detect whether a
+    journaled result still matches the current state of a file.
+    """
+    return hashlib.sha256(git_diff.encode('utf-8')).hexdigest()
+
+
+def _drop_partial_line(journal_path):
+    """
+    Truncates a trailing, newline-less record left behind by a crash mid-write,
+    so new records are never appended onto a corrupt line.
+    """
+    with open(journal_path, 'rb+') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if size == 0:
+            return
+        f.seek(size - 1)
+        if f.read(1) == b'\n':
+            return
+        f.seek(0)
+        data = f.read()
+        f.truncate(data.rfind(b'\n') + 1)
+
+
+class RunJournal:
+    """
+    Append-only journal of per-file generation results.
+
+    Each record is written as one compact JSON line:
+        {"p": "<path>", "h": "<diff sha256>", "r": <commit JSON or null>}
+    Records are flushed to the OS as soon as they are written, so a killed
+    process loses nothing, and fsynced every `fsync_every` records (and on
+    close), bounding what a power loss can take with it.
+    """
+
+    def __init__(self, journal_path, resume=False, fsync_every=32):
+        self.journal_path = journal_path
+        self.fsync_every = max(1, fsync_every)
+        self._pending = 0
+
+        if resume and os.path.isfile(journal_path):
+            _drop_partial_line(journal_path)
+            self._file = open(journal_path, 'a', encoding='utf-8')
+        else:
+            self._file = open(journal_path, 'w', encoding='utf-8')
+
+    def record(self, path, diff_hash, result):
+        """
+        Appends the result for a single file to the journal.
+        """
+        line = json.dumps({"p": path, "h": diff_hash, "r": result}, separators=(',', ':'))
+        self._file.write(line + '\n')
+        self._file.flush()
+        self._pending += 1
+        if self._pending >= self.fsync_every:
+            self.sync()
+
+    def sync(self):
+        """
+        Forces all written records to disk.
+        """
+        if self._pending:
+            os.fsync(self._file.fileno())
+            self._pending = 0
+
+    def close(self):
+        """
+        Syncs any outstanding records and closes the journal file.
+        """
+        if self._file.closed:
+            return
+        self.sync()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def read_journal(journal_path):
+    """
+    Streams the records of a journal as (path, diff_hash, result) tuples.
+    A truncated or malformed line, e.g. from a crash mid-write, is skipped.
+    """
+    if not os.path.isfile(journal_path):
+        return
+
+    with open(journal_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+                yield entry['p'], entry['h'], entry['r']
+            except (json.JSONDecodeError, KeyError, TypeError):
+                continue
+
+
+def load_completed(journal_path):
+    """
+    Returns a dictionary mapping each successfully generated file path to its
+    latest (diff_hash, result) pair. Failed generations are not considered done.
+    """
+    completed = {}
+    for path, diff_hash, result in read_journal(journal_path):
+        if result is None:
+            completed.pop(path, None)
+        else:
+            completed[path] = (diff_hash, result)
+    return completed
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python run_journal.py <journal_path>")
+        sys.exit(1)
+
+    for path, diff_hash, result in read_journal(sys.argv[1]):
+        status = "done" if result is not None else "failed"
+        print(f"{status:6} {diff_hash[:12]} {path}")
@@ -1,7 +1,7 @@
 import unittest
 from unittest.mock import patch, MagicMock
 import subprocess
-from git_changes import get_git_changes, get_git_diff
+from git_changes import get_git_changes, get_git_diff, get_git_dir
 
 
 class TestGitChanges(unittest.TestCase):
@@ -109,5 +109,21 @@ class TestGitChanges(unittest.TestCase):
         # Validate that no diff is returned
         self.assertIsNone(diff)
 
+    @patch('subprocess.check_output', return_value=b"/path/to/git/repo/.git\n")
+    def test_get_git_dir_valid_repo(self, mock_check_output):
+        """
+        Test get_git_dir with a valid Git repository path.
+        """
+        git_dir = get_git_dir("/path/to/git/repo")
+        self.assertEqual(git_dir, "/path/to/git/repo/.git")
+
+    @patch('subprocess.check_output', side_effect=subprocess.CalledProcessError(128, 'git'))
+    def test_get_git_dir_error(self, mock_check_output):
+        """
+        Test get_git_dir when the path is not a Git repository.
+        """
+        git_dir = get_git_dir("/path/to/not/a/repo")
+        self.assertIsNone(git_dir)
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,8 +1,9 @@
 import unittest
 import requests
 import sys
-from unittest.mock import patch
-from lm_studio_committer import commit_file_to_lm_studio
+from unittest.mock import patch, MagicMock
+from lm_studio_committer import commit_file_to_lm_studio, commit_files_to_lm_studio
+from run_journal import hash_diff
 
 
 class TestLMStudioPrompt(unittest.TestCase):
@@ -100,6 +101,46 @@ This is the last line of the file."""
         self.assertIn("text", response.json()["choices"][0])
 
 
+class TestCommitFilesResume(unittest.TestCase):
+
+    @patch('lm_studio_committer.commit_file_to_lm_studio')
+    @patch('lm_studio_committer.get_git_diff')
+    def test_resume_skips_unchanged_files(self, mock_get_git_diff, mock_commit_file):
+        """
+        Test that files already in the journal with an unchanged diff are not resent,
+        while new results are recorded to the journal.
+        """
+        done = {"commit": {"title": "Done", "body": "Already generated."}}
+        fresh = {"commit": {"title": "Fresh", "body": "Newly generated."}}
+        mock_get_git_diff.side_effect = lambda path: f"diff {path}"
+        mock_commit_file.return_value = fresh
+        journal = MagicMock()
+
+        files = [{"path": "a.txt", "content": ""}, {"path": "b.txt", "content": ""}]
+        completed = {"a.txt": (hash_diff("diff a.txt"), done)}
+        results = commit_files_to_lm_studio(files, "http://api", "token", journal=journal, completed=completed)
+
+        self.assertEqual(results, [done, fresh])
+        mock_commit_file.assert_called_once_with(files[1], "http://api", "token", "diff b.txt")
+        journal.record.assert_called_once_with("b.txt", hash_diff("diff b.txt"), fresh)
+
+    @patch('lm_studio_committer.commit_file_to_lm_studio')
+    @patch('lm_studio_committer.get_git_diff', return_value="diff changed")
+    def test_resume_regenerates_changed_files(self, mock_get_git_diff, mock_commit_file):
+        """
+        Test that a journaled file whose diff has changed since is generated again.
+        """
+        fresh = {"commit": {"title": "Fresh", "body": "Newly generated."}}
+        mock_commit_file.return_value = fresh
+
+        files = [{"path": "a.txt", "content": ""}]
+        completed = {"a.txt": (hash_diff("diff original"), {"commit": {}})}
+        results = commit_files_to_lm_studio(files, "http://api", "token", completed=completed)
+
+        self.assertEqual(results, [fresh])
+        mock_commit_file.assert_called_once()
+
+
 if __name__ == '__main__':
     # Handle custom arguments like `--real-api`
     if "--real-api" in sys.argv:
@@ -0,0 +1,96 @@
+import unittest
+import os
+import tempfile
+from run_journal import RunJournal, read_journal, load_completed, hash_diff
+
+
+class TestRunJournal(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Set up a temporary journal location for testing.
+        """
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.journal_path = os.path.join(self.test_dir.name, "journal.jsonl")
+        self.commit = {"commit": {"title": "Fix typo", "body": "Fixed a typo."}}
+
+    def tearDown(self):
+        """
+        Clean up the temporary journal.
+        """
+        self.test_dir.cleanup()
+
+    def test_record_and_read(self):
+        """
+        Test that recorded results are streamed back in order.
+        """
+        with RunJournal(self.journal_path) as journal:
+            journal.record("a.txt", hash_diff("diff a"), self.commit)
+            journal.record("b.txt", hash_diff("diff b"), None)
+
+        records = list(read_journal(self.journal_path))
+        self.assertEqual(records, [
+            ("a.txt", hash_diff("diff a"), self.commit),
+            ("b.txt", hash_diff("diff b"), None),
+        ])
+
+    def test_records_visible_before_close(self):
+        """
+        Test that each record reaches the file as soon as it is written.
+        """
+        journal = RunJournal(self.journal_path, fsync_every=100)
+        journal.record("a.txt", hash_diff("diff a"), self.commit)
+        self.assertEqual(len(list(read_journal(self.journal_path))), 1)
+        journal.close()
+
+    def test_without_resume_starts_fresh(self):
+        """
+        Test that opening a journal without resume discards earlier records.
+        """
+        with RunJournal(self.journal_path) as journal:
+            journal.record("a.txt", hash_diff("diff a"), self.commit)
+        with RunJournal(self.journal_path) as journal:
+            journal.record("b.txt", hash_diff("diff b"), self.commit)
+
+        paths = [path for path, _, _ in read_journal(self.journal_path)]
+        self.assertEqual(paths, ["b.txt"])
+
+    def test_resume_drops_partial_line(self):
+        """
+        Test that a record truncated by a crash is skipped and not appended onto.
+        """
+        with RunJournal(self.journal_path) as journal:
+            journal.record("a.txt", hash_diff("diff a"), self.commit)
+        with open(self.journal_path, 'a', encoding='utf-8') as f:
+            f.write('{"p":"b.txt","h":"ab')
+
+        self.assertEqual(len(list(read_journal(self.journal_path))), 1)
+
+        with RunJournal(self.journal_path, resume=True) as journal:
+            journal.record("c.txt", hash_diff("diff c"), self.commit)
+
+        paths = [path for path, _, _ in read_journal(self.journal_path)]
+        self.assertEqual(paths, ["a.txt", "c.txt"])
+
+    def test_load_completed(self):
+        """
+        Test that only successful generations are considered done, latest wins.
+        """
+        with RunJournal(self.journal_path) as journal:
+            journal.record("a.txt", hash_diff("diff a"), self.commit)
+            journal.record("b.txt", hash_diff("diff b"), None)
+            journal.record("c.txt", hash_diff("diff c"), self.commit)
+            journal.record("c.txt", hash_diff("diff c2"), None)
+
+        completed = load_completed(self.journal_path)
+        self.assertEqual(completed, {"a.txt": (hash_diff("diff a"), self.commit)})
+
+    def test_load_completed_missing_journal(self):
+        """
+        Test loading a journal that does not exist yet.
+        """
+        self.assertEqual(load_completed(self.journal_path), {})
+
+
+if __name__ == '__main__':
+    unittest.main()